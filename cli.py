@@ -1,20 +1,27 @@
 import click
+import functools
 import os
+import re
+import stat
+import tempfile
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
-from dotenv import load_dotenv, set_key
-import asyncio
-from trend import TokenScanner
-from swap import TradingBot, TradeAction
-from datetime import datetime
+from dotenv import load_dotenv
+from loop import run
 
-console = Console()
+# Shared by cli and menu; all output uses explicit markup, so the regex highlighter is off
+console = Console(highlight=False, emoji=False)
 
-def load_config():
-    """Load configuration from .env file"""
-    load_dotenv()
+ENV_FILE = '.env'
+
+# Load environment variables once; save_config keeps os.environ in sync afterwards
+load_dotenv(ENV_FILE)
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached():
+    """Build the configuration dict from the environment (cached until the next save)"""
     return {
         'private_key': os.getenv('PRIVATE_KEY'),
         'rpc_url': os.getenv('RPC_URL'),
@@ -23,10 +30,76 @@ def load_config():
         'sol_address': os.getenv('SOL_ADDRESS')
     }
 
+# Environment variables that must all be set before the bot can run
+_REQUIRED = ('PRIVATE_KEY', 'RPC_URL', 'SPIDER_SWAP_URL', 'SPIDER_SWAP_API_KEY', 'SOL_ADDRESS')
+
+def config_is_valid():
+    """Check that every required setting is present without building the config dict"""
+    return all(os.environ.get(key) for key in _REQUIRED)
+
+def load_config():
+    """Load configuration from .env file"""
+    # Hand out a copy so callers can update it without touching the cache
+    return dict(_load_config_cached())
+
+# Key of an assignment line in .env, with or without an `export` prefix
+_ENV_KEY_RE = re.compile(r'^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_.-]*)\s*=')
+
+def _quote_env_value(value):
+    """Single-quote a value the way dotenv's set_key() does"""
+    escaped = value.replace("'", "\\'")
+    return f"'{escaped}'"
+
+def _atomic_write_env(lines):
+    """Write all lines to the .env file at once, replacing it atomically"""
+    # mkstemp creates the file 0600; an existing .env keeps its own mode (it holds the wallet key)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(ENV_FILE)), prefix='.env.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as env_file:
+            env_file.writelines(lines)
+        if os.path.exists(ENV_FILE):
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(ENV_FILE).st_mode))
+        os.replace(tmp_path, ENV_FILE)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 def save_config(config):
     """Save configuration to .env file"""
-    for key, value in config.items():
-        set_key('.env', key.upper(), value)
+    updates = {key.upper(): value for key, value in config.items() if value is not None}
+    os.environ.update(updates)
+    
+    lines = []
+    if os.path.exists(ENV_FILE):
+        with open(ENV_FILE) as env_file:
+            lines = env_file.readlines()
+    
+    # One pass over the raw lines instead of one set_key() rewrite per key: saved keys are
+    # replaced in place (keeping any `export` prefix), everything else is left as written
+    written = set()
+    for i, line in enumerate(lines):
+        match = _ENV_KEY_RE.match(line)
+        if match and match.group(1) in updates:
+            lines[i] = f"{line[:match.end()]}{_quote_env_value(updates[match.group(1)])}\n"
+            written.add(match.group(1))
+    if lines and not lines[-1].endswith('\n'):
+        lines[-1] += '\n'
+    lines.extend(
+        f"{key}={_quote_env_value(value)}\n" for key, value in updates.items() if key not in written
+    )
+    
+    _atomic_write_env(lines)
+    _load_config_cached.cache_clear()
+
+# Settings that are masked when displayed, and their display labels
+_SENSITIVE = frozenset({'private_key', 'spider_swap_api_key'})
+_LABELS = {
+    key: key.replace('_', ' ').title()
+    for key in ('private_key', 'rpc_url', 'spider_swap_url', 'spider_swap_api_key', 'sol_address')
+}
 
 def display_config(config):
     """Display current configuration in a formatted table"""
@@ -36,9 +109,8 @@ def display_config(config):
     
     for key, value in config.items():
         # Mask sensitive information
-        if key in ['private_key', 'spider_swap_api_key']:
-            value = '********' + value[-4:] if value else 'Not Set'
-        table.add_row(key.replace('_', ' ').title(), str(value))
+        masked = f"********{value[-4:]}" if (key in _SENSITIVE and value) else (value or 'Not Set')
+        table.add_row(_LABELS[key], masked)
     
     return table
 
@@ -47,9 +119,8 @@ def cli():
     """Raydium Scalper - Solana Trading Bot"""
     pass
 
-@cli.command()
-def configure():
-    """Configure the trading bot settings"""
+def _run_wizard():
+    """Prompt for each setting and return the updated configuration"""
     config = load_config()
     
     console.print(Panel.fit(
@@ -91,10 +162,21 @@ def configure():
         'private_key': private_key,
         'sol_address': config['sol_address'] or "So11111111111111111111111111111111111111112"
     })
+    return config
+
+def configure_bot():
+    """Interactive configuration wizard"""
+    config = _run_wizard()
     
     # Save configuration
     save_config(config)
     console.print("[green]Configuration saved successfully![/green]")
+    return config
+
+@cli.command()
+def configure():
+    """Configure the trading bot settings"""
+    configure_bot()
 
 @cli.command()
 def show_config():
@@ -116,14 +198,16 @@ def scan_tokens():
         title="Token Scanner"
     ))
     
+    # Trading/network modules are imported on demand to keep CLI startup fast
+    from trend import TokenScanner
+    
     scanner = TokenScanner()
-    asyncio.run(scanner.get_trending_tokens())
+    run(scanner.get_trending_tokens())
 
 @cli.command()
 def start_bot():
     """Start the trading bot"""
-    config = load_config()
-    if not all(config.values()):
+    if not config_is_valid():
         console.print("[red]Error: Please configure the bot first using 'configure' command[/red]")
         return
     
@@ -133,6 +217,10 @@ def start_bot():
         title="Trading Bot"
     ))
     
+    from swap import TradingBot
+    from main import run_bot
+    
+    config = load_config()
     bot = TradingBot(
         private_key=config['private_key'],
         rpc_url=config['rpc_url'],
@@ -141,14 +229,12 @@ def start_bot():
         sol_mint=config['sol_address']
     )
     
-    scanner = TokenScanner()
-    asyncio.run(listen_for_events(bot, scanner))
+    run(run_bot(bot))
 
 @cli.command()
 def status():
     """Show bot status and statistics"""
-    config = load_config()
-    if not all(config.values()):
+    if not config_is_valid():
         console.print("[red]Error: Please configure the bot first using 'configure' command[/red]")
         return
     
@@ -171,66 +257,15 @@ def status():
     
     console.print(table)
 
-def configure_bot():
-    """Interactive configuration wizard"""
-    config = load_config()
-    
-    console.print(Panel.fit(
-        "[bold yellow]Raydium Scalper Configuration[/bold yellow]\n"
-        "Please enter your configuration details below.\n"
-        "Press Enter to keep the current value.",
-        title="Configuration Wizard"
-    ))
-    
-    # Get RPC URL
-    rpc_url = Prompt.ask(
-        "Solana RPC URL",
-        default=config['rpc_url'] or "https://mainnet.helius-rpc.com/?api-key=YOUR-API-KEY"
-    )
-    
-    # Get SpiderSwap API Key
-    spider_swap_api_key = Prompt.ask(
-        "SpiderSwap API Key",
-        default=config['spider_swap_api_key'] or "YOUR-API-KEY"
-    )
-    
-    # Get SpiderSwap URL
-    spider_swap_url = Prompt.ask(
-        "SpiderSwap API URL",
-        default=config['spider_swap_url'] or "https://api.spiderswap.com/v1/swap"
-    )
-    
-    # Get Private Key
-    private_key = Prompt.ask(
-        "Solana Wallet Private Key (base58)",
-        default=config['private_key'] or "YOUR-PRIVATE-KEY"
-    )
-    
-    # Update config
-    config.update({
-        'rpc_url': rpc_url,
-        'spider_swap_api_key': spider_swap_api_key,
-        'spider_swap_url': spider_swap_url,
-        'private_key': private_key,
-        'sol_address': config['sol_address'] or "So11111111111111111111111111111111111111112"
-    })
-    
-    # Save configuration
-    save_config(config)
-    console.print("[green]Configuration saved successfully![/green]")
-    return config
-
 def get_bot_status():
     """Get current bot status"""
-    config = load_config()
-    if not all(config.values()):
+    if not config_is_valid():
         return "Not Configured"
     return "Ready to Start"
 
 def validate_config():
     """Validate current configuration"""
-    config = load_config()
-    missing = [key for key, value in config.items() if not value]
+    missing = [key.lower() for key in _REQUIRED if not os.environ.get(key)]
     if missing:
         return False, f"Missing configuration: {', '.join(missing)}"
     return True, "Configuration valid"
@@ -0,0 +1,11 @@
+import asyncio
+
+def run(coro):
+    """Run coro to completion, on uvloop's libuv-backed event loop when available (not supported on Windows)"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    # A loop factory avoids uvloop.install(), which is deprecated on Python 3.12+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
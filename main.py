@@ -2,25 +2,19 @@
 import asyncio
 import logging
 import json
-import requests
 import os
 from dotenv import load_dotenv
 from swap import TradingBot, TradeAction
 from trend import TokenScanner
+from loop import run
 
 # Load environment variables
 load_dotenv()
 
-def fetch_pair_data(mint_address: str):
-    """
-    Fetch pair data from the dexscreener API using the token's mint address.
-    """
-    url = f"https://api.dexscreener.com/token-pairs/v1/solana/{mint_address}"
-    response = requests.get(url)
-    if response.status_code == 200:
-        return response.json()  # Expected to be a list of pairs
-    else:
-        raise Exception(f"Error fetching data from {url}")
+# Prediction thresholds
+M5_RATIO_THRESHOLD = 1.3
+SHORT_TERM_VOLUME_THRESHOLD = 100000  # Example threshold value
+THRESHOLD_SCORE = 3
 
 def predict_upward_movement(pair, debug=False):
     """
@@ -34,107 +28,137 @@ def predict_upward_movement(pair, debug=False):
       - bool: Prediction if upward movement is likely
       - float: Score indicating confidence in prediction
     """
-    score = 0
-    details = {}
-
     # 1. Transaction Imbalance: Focus on m5
-    try:
-        m5_buys = pair["txns"]["m5"]["buys"]
-        m5_sells = pair["txns"]["m5"]["sells"]
-    except KeyError:
+    m5_txns = pair.get("txns", {}).get("m5")
+    if m5_txns is None:
         return False, "Missing transaction data for m5"
-
-    # Avoid division by zero
-    m5_ratio = m5_buys / (m5_sells if m5_sells > 0 else 1)
-    details["m5_ratio"] = m5_ratio
-
-    if m5_ratio >= 1.3:
-        score += 1
+    m5_buys = m5_txns.get("buys", 0)
+    m5_sells = m5_txns.get("sells", 0) or 1  # Avoid division by zero
+    m5_ratio = m5_buys / m5_sells
 
     # 2. Short-Term Volume: Use the 5-minute volume for immediate activity
     m5_volume = pair.get("volume", {}).get("m5", 0)
-    details["m5_volume"] = m5_volume
 
-    SHORT_TERM_VOLUME_THRESHOLD = 100000  # Example threshold value
-    if m5_volume >= SHORT_TERM_VOLUME_THRESHOLD:
-        score += 2
+    # +1 for a favorable m5 ratio, +2 for high m5 volume
+    score = (m5_ratio >= M5_RATIO_THRESHOLD) + 2 * (m5_volume >= SHORT_TERM_VOLUME_THRESHOLD)
 
     if debug:
-        print("Debug Details:", json.dumps(details, indent=2))
+        print("Debug Details:", json.dumps({"m5_ratio": m5_ratio, "m5_volume": m5_volume}, indent=2))
 
-    THRESHOLD_SCORE = 3
-    prediction = score >= THRESHOLD_SCORE
-    return prediction, score
+    return score >= THRESHOLD_SCORE, score
 
-async def listen_for_events(bot: TradingBot, scanner: TokenScanner):
-    """Main event loop for processing trading signals"""
+MIN_MARKET_CAP = 500_000
+MAX_MARKET_CAP = 40_000_000
 
-    while True:
-        try:
-            # Skip if already in a position
-            if bot.current_position:
-                await asyncio.sleep(3)
-                continue
-
-            # Fetch trending tokens
-            tokens = await scanner.get_trending_tokens()
-            top_tokens = tokens[:1]
-            if not top_tokens:
-                bot.logger.info("No trending tokens found. Retrying in 10 seconds...")
-                await asyncio.sleep(10)
-                continue
-
-            for top_token in top_tokens:
-                token_address = top_token['address']
-                bot.logger.info(f"Evaluating {top_token['name']} ({token_address})")
-
-                if token_address in bot.blacklisted_tokens:
-                    bot.logger.info(f"Already traded {token_address}. Skipping...")
-                    continue
+SCAN_INTERVAL = 5        # Seconds between scans while the market is active
+MAX_SCAN_INTERVAL = 60   # Upper bound after repeated empty scans
+PROMISING_SCORE = THRESHOLD_SCORE - 1  # One point short of a buy signal
 
-                # Market cap filter
-                market_cap = await bot.fetch_usd_market_cap(token_address)
-                if market_cap is None:
-                    bot.logger.info(f"Couldn't fetch market cap for {token_address}")
+def scan_interval(empty_scans: int) -> int:
+    """Back off exponentially after consecutive scans without a promising token."""
+    return min(MAX_SCAN_INTERVAL, SCAN_INTERVAL * 2 ** min(empty_scans, 4))
+
+async def listen_for_events(bot: TradingBot, scanner: TokenScanner):
+    """Main event loop for processing trading signals"""
+    empty_scans = 0
+
+    # Monitor tasks belong to the group: they are awaited on exit and cancelled on failure
+    async with asyncio.TaskGroup() as tg:
+        while True:
+            try:
+                # Wait for the open position to be closed before scanning again
+                if bot.current_position:
+                    await bot.position_closed.wait()
+                    bot.position_closed.clear()
                     continue
 
-                if market_cap > 40_000_000 or market_cap < 500_000:
-                    bot.logger.info(f"Skipping {token_address} (MC: ${market_cap:,.2f})")
+                # Fetch trending tokens
+                tokens = await scanner.get_trending_tokens()
+                top_tokens = tokens[:1]
+                if not top_tokens:
+                    empty_scans += 1
+                    interval = scan_interval(empty_scans)
+                    bot.logger.info(f"No trending tokens found. Retrying in {interval} seconds...")
+                    await bot.wait_for_position_closed(interval)
                     continue
 
-                # === Final Check: Pair data prediction based on mint address ===
-                try:
-                    loop = asyncio.get_event_loop()
-                    pair_data = await loop.run_in_executor(None, fetch_pair_data, token_address)
+                # Drop already-traded tokens and known out-of-range caps before spending any requests on them
+                candidates = []
+                for top_token in top_tokens:
+                    market_cap = bot.cached_market_cap(top_token.address)
+                    if top_token.address in bot.blacklisted_tokens:
+                        bot.logger.info(f"Already traded {top_token.address}. Skipping...")
+                    elif market_cap is not None and not MIN_MARKET_CAP <= market_cap <= MAX_MARKET_CAP:
+                        bot.logger.info(f"Skipping {top_token.address} (MC: ${market_cap:,.2f})")
+                    else:
+                        candidates.append(top_token)
+
+                # One DexScreener request per candidate serves both the market cap and the prediction
+                pairs = await asyncio.gather(
+                    *(bot.fetch_token_pairs(token.address) for token in candidates), return_exceptions=True
+                )
+
+                promising = False
+                for top_token, pair_data in zip(candidates, pairs):
+                    token_address = top_token.address
+                    bot.logger.info(f"Evaluating {top_token.name} ({token_address})")
+
+                    if isinstance(pair_data, Exception):
+                        bot.logger.error(f"Error fetching pair data for {token_address}: {str(pair_data)}")
+                        continue
                     if not pair_data:
                         bot.logger.info(f"No pair data found for {token_address}")
                         continue
 
-                    prediction, score = predict_upward_movement(pair_data[0], debug=True)
-                    if not prediction:
-                        bot.logger.info(
-                            f"Skipping {token_address} - Unfavorable pair data prediction (Score: {score})"
-                        )
+                    # Market cap filter
+                    market_cap = pair_data[0].get('marketCap')
+                    if market_cap is None:
+                        bot.logger.info(f"Couldn't fetch market cap for {token_address}")
                         continue
 
-                except Exception as e:
-                    bot.logger.error(f"Error during pair data prediction for {token_address}: {str(e)}")
-                    continue
-                # === End of final check ===
-
-                # Execute trade for new trending tokens
-                trade_result = await bot.execute_trade(token_address, TradeAction.BUY)
-                if trade_result:
-                    bot.current_position = token_address
-                    bot.blacklisted_tokens.add(token_address)
-                    asyncio.create_task(bot.monitor_token(token_address))
-                    break  # Stop evaluating after successful trade
-
-            await asyncio.sleep(10)
+                    if not MIN_MARKET_CAP <= market_cap <= MAX_MARKET_CAP:
+                        bot.logger.info(f"Skipping {token_address} (MC: ${market_cap:,.2f})")
+                        continue
 
-        except Exception as e:
-            bot.logger.error(f"Event loop error: {str(e)}")
-            await asyncio.sleep(5)
+                    # === Final Check: Pair data prediction based on mint address ===
+                    try:
+                        prediction, score = predict_upward_movement(pair_data[0], debug=True)
+                        if isinstance(score, int) and score >= PROMISING_SCORE:
+                            promising = True
+                        if not prediction:
+                            bot.logger.info(
+                                f"Skipping {token_address} - Unfavorable pair data prediction (Score: {score})"
+                            )
+                            continue
+
+                    except Exception as e:
+                        bot.logger.error(f"Error during pair data prediction for {token_address}: {str(e)}")
+                        continue
+                    # === End of final check ===
+
+                    # Execute trade for new trending tokens
+                    trade_result = await bot.execute_trade(token_address, TradeAction.BUY)
+                    if trade_result:
+                        bot.current_position = token_address
+                        bot.blacklisted_tokens.add(token_address)
+                        tg.create_task(bot.monitor_token(token_address))
+                        break  # Stop evaluating after successful trade
+
+                # Poll faster while close-to-threshold tokens show up, back off when idle
+                empty_scans = 0 if promising else empty_scans + 1
+                await bot.wait_for_position_closed(scan_interval(empty_scans))
+
+            except Exception as e:
+                bot.logger.error(f"Event loop error: {str(e)}")
+                await asyncio.sleep(5)
+
+async def run_bot(bot: TradingBot):
+    """Run the trading loop, sharing the bot's connection pool with the scanner"""
+    try:
+        scanner = TokenScanner(session=await bot.get_session())
+        await listen_for_events(bot, scanner)
+    finally:
+        await bot.close()
 
 async def main():
     try:
@@ -151,19 +175,15 @@ async def main():
             api_key=os.getenv("SPIDER_SWAP_API_KEY"),
             sol_mint=os.getenv("SOL_ADDRESS")
         )
-        scanner = TokenScanner()
 
         # Start main loop
-        await listen_for_events(bot, scanner)
+        await run_bot(bot)
 
     except Exception as e:
         logging.error(f"Fatal error: {str(e)}")
-    finally:
-        if 'bot' in locals():
-            await bot.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
 
 
 
@@ -1,23 +1,18 @@
 import os
 import sys
-import asyncio
-from rich.console import Console
+from loop import run
 from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
 from rich.live import Live
 from rich.layout import Layout
 from rich.text import Text
-from datetime import datetime
+from collections import deque
 import time
 from cli import (
     load_config, save_config, display_config, configure_bot,
-    get_bot_status, validate_config
+    get_bot_status, validate_config, console
 )
-from trend import TokenScanner
-from swap import TradingBot, TradeAction
-
-console = Console()
 
 def create_header():
     """Create the header panel"""
@@ -39,27 +34,58 @@ def create_menu():
     table.add_row("[bold cyan]6[/bold cyan]", "Exit")
     return Panel(table, title="Menu", border_style="blue", expand=False)
 
-def create_status_panel(status_text="Ready to start"):
-    """Create the status panel"""
+def create_status_panel(status_text):
+    """Create the status panel around a Text body that is updated in place"""
     return Panel(
-        f"[bold green]Bot Status[/bold green]\n{status_text}",
+        status_text,
         title="Status",
         border_style="green",
         expand=False
     )
 
-def create_log_panel(log_text="No recent activity"):
-    """Create the log panel"""
+def create_log_panel(log_text):
+    """Create the log panel around a Text body that is updated in place"""
     return Panel(
-        f"[bold yellow]Bot Log[/bold yellow]\n{log_text}",
+        log_text,
         title="Log",
         border_style="yellow",
         expand=False
     )
 
-async def scan_tokens():
+def set_panel_text(text, heading, heading_style, body):
+    """Replace the contents of a panel's Text body with a styled heading and plain body"""
+    text.plain = ""
+    text.append(heading, style=heading_style)
+    text.append(f"\n{body}")
+
+# Panels are built once; the status and log bodies are mutated instead of rebuilt
+HEADER_PANEL = create_header()
+MENU_PANEL = create_menu()
+_status_text = Text()
+_log_text = Text()
+STATUS_PANEL = create_status_panel(_status_text)
+LOG_PANEL = create_log_panel(_log_text)
+
+_last_timestamp = [0, ""]
+
+def _timestamp():
+    """Current local time as HH:MM:SS, reformatted at most once per second"""
+    now = int(time.time())
+    if now != _last_timestamp[0]:
+        _last_timestamp[0] = now
+        _last_timestamp[1] = time.strftime('%H:%M:%S', time.localtime(now))
+    return _last_timestamp[1]
+
+def update_status_panel(status_text="Ready to start"):
+    """Update the status panel body"""
+    set_panel_text(_status_text, "Bot Status", "bold green", status_text)
+
+def update_log_panel(log_text="No recent activity"):
+    """Update the log panel body"""
+    set_panel_text(_log_text, "Bot Log", "bold yellow", log_text)
+
+async def scan_tokens(scanner):
     """Scan for trending tokens"""
-    scanner = TokenScanner()
     tokens = await scanner.get_trending_tokens()
     
     table = Table(title="Trending Tokens", expand=True)
@@ -69,23 +95,30 @@ async def scan_tokens():
     table.add_column("Volume 1h", style="magenta")
     table.add_column("Price Change", style="red")
     
-    for token in tokens[:5]:  # Show top 5 tokens
-        table.add_row(
-            token['name'],
-            token['address'][:8] + "...",
-            f"${token['base_token_price']:.8f}",
-            f"${token['volume_1h']:,.2f}",
-            f"{token['price_change_1h']}%"
+    # Format all rows in one pass, then hand them to the table
+    rows = [
+        (
+            token.name,
+            token.address[:8] + "...",
+            f"${token.base_token_price:.8f}",
+            f"${token.volume_1h:,.2f}",
+            f"{token.price_change_1h}%"
         )
+        for token in tokens[:5]  # Show top 5 tokens
+    ]
+    for row in rows:
+        table.add_row(*row)
     
     return table
 
 async def start_bot():
-    """Start the trading bot"""
+    """Start the trading bot, returning the bot (None on failure) and a status message"""
     # Validate configuration
     is_valid, message = validate_config()
     if not is_valid:
-        return f"Error: {message}"
+        return None, f"Error: {message}"
+    
+    from swap import TradingBot
     
     config = load_config()
     try:
@@ -96,10 +129,9 @@ async def start_bot():
             api_key=config['spider_swap_api_key'],
             sol_mint=config['sol_address']
         )
-        scanner = TokenScanner()
-        return "Bot started successfully"
+        return bot, "Bot started successfully"
     except Exception as e:
-        return f"Error starting bot: {str(e)}"
+        return None, f"Error starting bot: {str(e)}"
 
 def main():
     """Main menu loop"""
@@ -122,19 +154,28 @@ def main():
         Layout(name="log", ratio=1)
     )
     
+    layout["header"].update(HEADER_PANEL)
+    layout["menu"].update(MENU_PANEL)
+    layout["status"].update(STATUS_PANEL)
+    layout["log"].update(LOG_PANEL)
+    
     bot_running = False
-    log_messages = []
+    log_messages = deque(maxlen=5)  # Only the last 5 entries are shown
+    
+    def add_log(message):
+        log_messages.append(f"[{_timestamp()}] {message}")
+        update_log_panel("\n".join(log_messages))
+    
+    # Created on first use and reused across menu iterations
+    scanner = None
+    bot = None
+    update_status_panel(get_bot_status())
+    update_log_panel("")
     
     while True:
         # Clear screen
         console.clear()
         
-        # Update layout
-        layout["header"].update(create_header())
-        layout["menu"].update(create_menu())
-        layout["status"].update(create_status_panel(get_bot_status()))
-        layout["log"].update(create_log_panel("\n".join(log_messages[-5:])))
-        
         # Display the layout
         console.print(layout)
         
@@ -144,7 +185,8 @@ def main():
         if choice == "1":
             # Configure bot
             configure_bot()
-            log_messages.append(f"[{datetime.now().strftime('%H:%M:%S')}] Configuration updated")
+            update_status_panel(get_bot_status())
+            add_log("Configuration updated")
             
         elif choice == "2":
             # Show configuration
@@ -155,24 +197,26 @@ def main():
         elif choice == "3":
             # Scan tokens
             console.print("\nScanning for trending tokens...")
-            tokens_table = asyncio.run(scan_tokens())
+            if scanner is None:
+                from trend import TokenScanner
+                scanner = TokenScanner()
+            tokens_table = run(scan_tokens(scanner))
             console.print(tokens_table)
             input("\nPress Enter to continue...")
             
         elif choice == "4":
             # Start bot
             if not bot_running:
-                status = asyncio.run(start_bot())
-                if "Error" not in status:
-                    bot_running = True
-                log_messages.append(f"[{datetime.now().strftime('%H:%M:%S')}] {status}")
+                bot, status = run(start_bot())
+                bot_running = bot is not None
+                add_log(status)
             else:
-                log_messages.append(f"[{datetime.now().strftime('%H:%M:%S')}] Bot is already running")
+                add_log("Bot is already running")
             
         elif choice == "5":
             # Show status
             status_text = "Bot is running" if bot_running else "Bot is stopped"
-            layout["status"].update(create_status_panel(status_text))
+            update_status_panel(status_text)
             input("\nPress Enter to continue...")
             
         elif choice == "6":
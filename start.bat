@@ -4,7 +4,7 @@ color 0A
 REM Check if Python is installed
 python --version >nul 2>&1
 if errorlevel 1 (
-    echo Python is not installed! Please install Python 3.8 or higher.
+    echo Python is not installed! Please install Python 3.11 or higher.
     pause
     exit /b 1
 )
@@ -2,17 +2,113 @@
 
 import aiohttp
 import asyncio
+import functools
 import logging
+import orjson
+import random
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solders.transaction import VersionedTransaction
-import base64
 from typing import Optional, Tuple
 from decimal import Decimal
 import time
-import requests
 from enum import Enum
 
+# pybase64 is a SIMD-accelerated drop-in for the stdlib module
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# JSON-RPC bodies are sent pre-serialized; only the variable fields are spliced in
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_GET_ACCOUNT_INFO_TEMPLATE = (
+    b'{"jsonrpc":"2.0","id":1,"method":"getAccountInfo",'
+    b'"params":["%b",{"encoding":"jsonParsed"}]}'
+)
+# Same account read at two commitment levels in one batched request
+_GET_ACCOUNT_INFO_STABLE_TEMPLATE = (
+    b'[{"jsonrpc":"2.0","id":1,"method":"getAccountInfo",'
+    b'"params":["%b",{"encoding":"jsonParsed","commitment":"processed"}]},'
+    b'{"jsonrpc":"2.0","id":2,"method":"getAccountInfo",'
+    b'"params":["%b",{"encoding":"jsonParsed","commitment":"confirmed"}]}]'
+)
+# Balance reads fetch only the bytes they decode: the u64 amount at offset 64 of the
+# token account and, until a mint's decimals are cached, the u8 decimals at offset 44 of the mint
+_TOKEN_AMOUNT_SLICE = (
+    b'{"jsonrpc":"2.0","id":1,"method":"getAccountInfo",'
+    b'"params":["%b",{"encoding":"base64","dataSlice":{"offset":64,"length":8}}]}'
+)
+_MINT_DECIMALS_SLICE = (
+    b'{"jsonrpc":"2.0","id":2,"method":"getAccountInfo",'
+    b'"params":["%b",{"encoding":"base64","dataSlice":{"offset":44,"length":1}}]}'
+)
+_GET_TOKEN_AMOUNT_SLICE_TEMPLATE = b'[' + _TOKEN_AMOUNT_SLICE + b',' + _MINT_DECIMALS_SLICE + b']'
+_GET_TOKEN_AMOUNT_CACHED_TEMPLATE = b'[' + _TOKEN_AMOUNT_SLICE + b']'
+# The commitment pair above, amount slice only (used once the mint's decimals are cached)
+_GET_TOKEN_AMOUNT_STABLE_TEMPLATE = (
+    b'[{"jsonrpc":"2.0","id":1,"method":"getAccountInfo","params":["%b",'
+    b'{"encoding":"base64","dataSlice":{"offset":64,"length":8},"commitment":"processed"}]},'
+    b'{"jsonrpc":"2.0","id":2,"method":"getAccountInfo","params":["%b",'
+    b'{"encoding":"base64","dataSlice":{"offset":64,"length":8},"commitment":"confirmed"}]}]'
+)
+_SEND_TRANSACTION_PREFIX = b'{"jsonrpc":"2.0","id":1,"method":"sendTransaction","params":["'
+_SEND_TRANSACTION_SUFFIX = b'",{"encoding":"base64","skipPreflight":false,"maxRetries":3}]}'
+
+TOKEN_PROGRAM_ID = Pubkey.from_string("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA")
+ASSOCIATED_TOKEN_PROGRAM_ID = Pubkey.from_string("ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL")
+_TOKEN_PROGRAM_BYTES = bytes(TOKEN_PROGRAM_ID)
+_TOKEN_PROGRAM_STR = str(TOKEN_PROGRAM_ID)
+
+@functools.lru_cache(maxsize=256)
+def _associated_token_address(owner: bytes, mint: str) -> str:
+    """Derive the associated token account for an owner (raw pubkey bytes) and mint (memoized)."""
+    associated_token_address, _ = Pubkey.find_program_address(
+        [
+            owner,
+            _TOKEN_PROGRAM_BYTES,
+            bytes(Pubkey.from_string(mint)),
+        ],
+        ASSOCIATED_TOKEN_PROGRAM_ID
+    )
+    return str(associated_token_address)
+
+# Trade sizing constants, hoisted out of execute_trade()
+MIN_SOL_BALANCE = Decimal('0.0001')
+BUY_BALANCE_FRACTION = Decimal('0.1')
+LAMPORTS_PER_SOL = 10**9
+PRIORITY_MICRO_LAMPORTS = 100_000  # 0.0001 * 10**9
+
+# Price polling cadence while a position is held
+PRICE_POLL_INTERVAL = 2
+# Prices this fresh are shared between the monitor loop and trade verification
+PRICE_CACHE_TTL = 0.25
+
+def decorrelated_jitter(previous: float, base: float = 0.5, cap: float = 5.0) -> float:
+    """Next retry delay (decorrelated jitter): uniform between base and 3x the previous, capped."""
+    return min(cap, random.uniform(base, previous * 3))
+
+async def _read_json(response: aiohttp.ClientResponse):
+    """Decode a response body with orjson; a non-2xx reply that isn't JSON raises ClientResponseError."""
+    body = await response.read()
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        # Gateway and rate-limit pages (429/502 HTML) stay retryable network errors
+        if not response.ok:
+            response.raise_for_status()
+        raise
+
+# Market caps are reused for this many seconds so rapid re-scans can skip out-of-range tokens
+MARKET_CAP_TTL = 30
+MARKET_CAP_CACHE_SIZE = 512
+PAIRS_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# Per-request budget: a stalled server costs one short attempt, leaving room for retries
+SESSION_TIMEOUT = aiohttp.ClientTimeout(total=8, connect=2, sock_read=5, sock_connect=2)
+# Network failures that have persisted this long (seconds) are treated as an outage, not a blip
+NETWORK_OUTAGE_LIMIT = 20
+
 class TradeAction(Enum):
     BUY = "buy"
     SELL = "sell"
@@ -25,9 +121,18 @@ class TradingBot:
         try:
             self.keypair = Keypair.from_base58_string(private_key.strip())
             self.wallet_address = str(self.keypair.pubkey())
+            self._owner_bytes = bytes(self.keypair.pubkey())  # Reused for every ATA derivation
         except Exception as e:
             raise ValueError(f"Invalid private key: {str(e)}")
 
+        # The balance request never changes, so serialize it once
+        self._get_balance_payload = orjson.dumps({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "getBalance",
+            "params": [self.wallet_address]
+        })
+
         # Configuration
         self.rpc_url = rpc_url
         self.swap_url = swap_url
@@ -37,7 +142,13 @@ class TradingBot:
         # State management
         self.current_position = None
         self.position_open_time = None
+        self.position_closed = asyncio.Event()
         self.blacklisted_tokens = set()
+        self._market_cap_cache = {}  # token_address -> (expires_at, market_cap)
+        self._price_cache = {}  # token_address -> (expires_at, price)
+        self._price_requests = {}  # token_address -> in-flight price lookup task
+        self._decimals_cache = {}  # mint -> decimals (fixed for the life of a mint)
+        self._network_failing_since = None  # monotonic time of the first failure since the last RPC success
         self.buy_price = Decimal(0)
         self.session = None
         self.semaphore = asyncio.Semaphore(5)
@@ -49,66 +160,162 @@ class TradingBot:
 
     def setup_logging(self):
         self.logger = logging.getLogger(__name__)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+        # Only attach a handler if nothing up the chain (e.g. trend's basicConfig) handles
+        # our records already; otherwise every record would be formatted and printed twice
+        if not self.logger.hasHandlers():
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
         self.logger.setLevel(logging.INFO)
 
+    def close_position(self):
+        """Clear the current position and notify anyone waiting on position_closed."""
+        self.current_position = None
+        self.position_open_time = None
+        self.position_closed.set()
+
+    async def wait_for_position_closed(self, timeout: float) -> bool:
+        """Sleep for up to `timeout` seconds, returning early (True) when a position closes."""
+        try:
+            await asyncio.wait_for(self.position_closed.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self.position_closed.clear()
+
     async def get_session(self) -> aiohttp.ClientSession:
         if self.session is None or self.session.closed:
             self.session = aiohttp.ClientSession(
-                connector=aiohttp.TCPConnector(limit=25),
-                timeout=aiohttp.ClientTimeout(total=30)
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=16,  # No single API host can starve the others
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True
+                ),
+                timeout=SESSION_TIMEOUT
             )
         return self.session
+
+    def _note_network_failure(self):
+        if self._network_failing_since is None:
+            self._network_failing_since = time.monotonic()
+
+    def network_outage_duration(self) -> float:
+        """Seconds that network calls have been failing without an RPC success in between."""
+        if self._network_failing_since is None:
+            return 0.0
+        return time.monotonic() - self._network_failing_since
     
-    async def fetch_usd_market_cap(self, token_address: str) -> Optional[Decimal]:
-        """Fetch market cap from DexScreener API"""
+    async def _rpc_post(self, payload: bytes):
+        """POST a pre-serialized JSON-RPC payload and decode the response with orjson."""
+        session = await self.get_session()
         try:
-            # Use asyncio.to_thread to run synchronous requests in a thread
-            market_cap = await asyncio.to_thread(self._fetch_market_cap_sync, token_address)
-            return Decimal(str(market_cap)) if market_cap is not None else None
-        except Exception as e:
-            self.logger.error(f"Market cap check failed: {str(e)}")
-            return None
+            async with session.post(self.rpc_url, data=payload, headers=_JSON_HEADERS) as response:
+                data = await _read_json(response)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self._note_network_failure()
+            raise
+        self._network_failing_since = None
+        return data
+
+    def cached_market_cap(self, token_address: str) -> Optional[Decimal]:
+        """Market cap from a recent fetch_token_pairs() call, or None once it has expired"""
+        cached = self._market_cap_cache.get(token_address)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        return None
 
-    def _fetch_market_cap_sync(self, token_address: str) -> Optional[float]:
-        """Synchronous helper function to fetch market cap"""
+    async def fetch_token_pairs(self, token_address: str) -> list:
+        """Fetch the token's pairs from DexScreener and cache the first pair's market cap"""
         url = f"https://api.dexscreener.com/token-pairs/v1/solana/{token_address}"
-        #rate_limiter()  # Apply rate limiting
-        try:
-            response = requests.get(url, timeout=5)
+        session = await self.get_session()
+        async with session.get(url, timeout=PAIRS_TIMEOUT) as response:
             response.raise_for_status()
-            data = response.json()
-            if isinstance(data, list) and data:
-                return data[0].get('marketCap')
-        except Exception as e:
-            self.logger.error(f"Error fetching market cap for {token_address}: {str(e)[:100]}")
-        return None
-    
+            pairs = orjson.loads(await response.read())
+        if not isinstance(pairs, list):
+            return []
+
+        market_cap = pairs[0].get('marketCap') if pairs else None
+        if market_cap is not None:
+            now = time.monotonic()
+            if len(self._market_cap_cache) >= MARKET_CAP_CACHE_SIZE:
+                # Drop expired entries; start over if everything is still fresh
+                self._market_cap_cache = {
+                    address: entry for address, entry in self._market_cap_cache.items() if entry[0] > now
+                }
+                if len(self._market_cap_cache) >= MARKET_CAP_CACHE_SIZE:
+                    self._market_cap_cache.clear()
+            self._market_cap_cache[token_address] = (now + MARKET_CAP_TTL, Decimal(str(market_cap)))
+        return pairs
 
-    def get_associated_token_address(self, mint_address: str) -> Pubkey:
+    def get_associated_token_address(self, mint_address: str) -> str:
         """Compute the associated token account address using Solders types."""
         try:
-            owner_pubkey = Pubkey.from_string(self.wallet_address)
-            mint_pubkey = Pubkey.from_string(mint_address)
-            token_program_id = Pubkey.from_string("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA")  # TOKEN_PROGRAM_ID
-            associated_token_program_id = Pubkey.from_string("ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL")  # ASSOCIATED_TOKEN_PROGRAM_ID
-            
-            associated_token_address, _ = Pubkey.find_program_address(
-                [
-                    bytes(owner_pubkey),
-                    bytes(token_program_id),
-                    bytes(mint_pubkey),
-                ],
-                associated_token_program_id
-            )
-            return associated_token_address
+            return _associated_token_address(self._owner_bytes, mint_address)
         except Exception as e:
             self.logger.error(f"ATA computation failed: {str(e)}")
             raise
 
+    def _parse_token_account(self, account_info: Optional[dict]) -> Optional[dict]:
+        """Extract the token amount from a jsonParsed getAccountInfo value."""
+        if not account_info:
+            return None  # ATA doesn't exist
+
+        if account_info['data']['program'] != 'spl-token':
+            self.logger.warning("Invalid account type")
+            return None
+
+        info = account_info['data']['parsed']['info']
+        token_data = info['tokenAmount']
+        decimals = int(token_data['decimals'])
+        if 'mint' in info:
+            self._decimals_cache[info['mint']] = decimals
+        return {
+            'raw_amount': int(token_data['amount']),
+            'decimals': decimals,
+            'ui_amount': Decimal(token_data['uiAmount'])
+        }
+
+    @staticmethod
+    def _sliced_token_data(account_info: Optional[dict]) -> Optional[bytes]:
+        """Decode a dataSlice'd base64 getAccountInfo value, if the token program owns it."""
+        if not account_info or account_info.get('owner') != _TOKEN_PROGRAM_STR:
+            return None
+        return base64.b64decode(account_info['data'][0], validate=False)
+
+    def _parse_token_amount_slice(self, account_info: Optional[dict], decimals: int) -> Optional[dict]:
+        """Build token info from the 8-byte amount slice and known decimals, or None if unusable."""
+        amount = self._sliced_token_data(account_info)
+        if amount is None or len(amount) != 8:
+            return None
+        raw_amount = int.from_bytes(amount, 'little')
+        return {
+            'raw_amount': raw_amount,
+            'decimals': decimals,
+            'ui_amount': Decimal(raw_amount) / 10 ** decimals
+        }
+
+    async def _get_ata_stable(self, token_address: str) -> Tuple[bool, Optional[dict]]:
+        """Read the ATA at 'processed' and 'confirmed' in one batch; stable when both agree."""
+        ata_bytes = self.get_associated_token_address(token_address).encode()
+        decimals = self._decimals_cache.get(token_address)
+        if decimals is None:
+            template, parse = _GET_ACCOUNT_INFO_STABLE_TEMPLATE, self._parse_token_account
+        else:
+            template = _GET_TOKEN_AMOUNT_STABLE_TEMPLATE
+            parse = functools.partial(self._parse_token_amount_slice, decimals=decimals)
+        responses = await self._rpc_post(template % (ata_bytes, ata_bytes))
+        results = {r.get('id'): r.get('result') for r in responses} if isinstance(responses, list) else {}
+        processed, confirmed = (
+            parse((results.get(request_id) or {}).get('value'))
+            for request_id in (1, 2)
+        )
+        if processed and confirmed and processed['raw_amount'] == confirmed['raw_amount']:
+            return True, confirmed
+        return False, confirmed or processed
+
     async def get_token_account_info(self, token_address: str, max_retries: int = 5) -> Optional[dict]:
         """Get token balance by directly checking the associated token account."""
         retry_delay = 1.5
@@ -120,43 +327,42 @@ class TradingBot:
             return None
 
         for attempt in range(max_retries):
+            # Decimals never change for a mint, so once known only the amount is fetched
+            decimals = self._decimals_cache.get(token_address)
+            if decimals is None:
+                payload = _GET_TOKEN_AMOUNT_SLICE_TEMPLATE % (ata_pubkey.encode(), token_address.encode())
+            else:
+                payload = _GET_TOKEN_AMOUNT_CACHED_TEMPLATE % ata_pubkey.encode()
             try:
-                session = await self.get_session()
-                async with session.post(
-                    self.rpc_url,
-                    json={
-                        "jsonrpc": "2.0",
-                        "id": 1,
-                        "method": "getAccountInfo",
-                        "params": [
-                            str(ata_pubkey),
-                            {"encoding": "jsonParsed"}
-                        ]
-                    }
-                ) as response:
-                    data = await response.json()
-                    
-                    if 'result' not in data:
-                        self.logger.warning(f"RPC response error (attempt {attempt+1}/{max_retries})")
-                        await asyncio.sleep(retry_delay * (attempt + 1))
-                        continue
-
-                    account_info = data['result']['value']
-                    if not account_info:
-                        return None  # ATA doesn't exist
-
-                    if account_info['data']['program'] != 'spl-token':
-                        self.logger.warning("Invalid account type")
-                        return None
-
-                    token_data = account_info['data']['parsed']['info']['tokenAmount']
-                    return {
-                        'raw_amount': int(token_data['amount']),
-                        'decimals': int(token_data['decimals']),
-                        'ui_amount': Decimal(token_data['uiAmount'])
-                    }
+                responses = await self._rpc_post(payload)
+                results = {
+                    r.get('id'): r['result'] for r in responses if 'result' in r
+                } if isinstance(responses, list) else {}
+                
+                if 1 not in results or (decimals is None and 2 not in results):
+                    self.logger.warning("RPC response error (attempt %d/%d)", attempt + 1, max_retries)
+                    await asyncio.sleep(retry_delay * (attempt + 1))
+                    continue
+
+                if not results[1]['value']:
+                    return None  # ATA doesn't exist
+
+                if decimals is None:
+                    mint_data = self._sliced_token_data(results[2]['value'])
+                    if mint_data:
+                        decimals = self._decimals_cache[token_address] = mint_data[0]
+
+                token_info = None
+                if decimals is not None:
+                    token_info = self._parse_token_amount_slice(results[1]['value'], decimals)
+                if token_info:
+                    return token_info
+
+                # Slices didn't decode (unexpected owner or mint layout): let jsonParsed decide
+                data = await self._rpc_post(_GET_ACCOUNT_INFO_TEMPLATE % ata_pubkey.encode())
+                return self._parse_token_account(data['result']['value'])
             except Exception as e:
-                self.logger.warning(f"Balance check failed (attempt {attempt+1}): {str(e)}")
+                self.logger.warning("Balance check failed (attempt %d): %s", attempt + 1, e)
                 await asyncio.sleep(retry_delay * (attempt + 1))
         
         self.logger.error("Max retries reached for token balance check")
@@ -164,6 +370,17 @@ class TradingBot:
 
     async def verify_token_balance(self, token_address: str, min_retries: int = 3) -> Tuple[bool, Optional[dict]]:
         """Verify balance with enhanced consistency checks."""
+        try:
+            stable, token_info = await self._get_ata_stable(token_address)
+            if stable:
+                if token_info['raw_amount'] <= 0:
+                    self.logger.warning("Zero balance detected")
+                    return False, None
+                return True, token_info
+        except Exception as e:
+            self.logger.warning("Batched balance check failed: %s", e)
+
+        # Balance still settling between commitment levels (or the batch failed): poll it out
         confirmations = 0
         last_info = None
         
@@ -190,7 +407,8 @@ class TradingBot:
                            priority_multiplier: Decimal = Decimal('1'),
                            slippage_bps: int = 2000) -> bool:
         max_retries = 3
-        retry_delay = 0.5
+        retry_delay = 0.5  # Grows with decorrelated jitter across attempts
+        sol_balance = None  # Fetched once; a failed send doesn't change it
         
         for attempt in range(max_retries + 1):
             try:
@@ -204,18 +422,19 @@ class TradingBot:
                             self.logger.info(f"Cooldown active. Next buy allowed in {remaining:.1f} seconds.")
                             return False
                         
-                        sol_balance = await self.get_sol_balance()
-                        if sol_balance < Decimal('0.0001'):
+                        if sol_balance is None:
+                            sol_balance = await self.get_sol_balance()
+                        if sol_balance < MIN_SOL_BALANCE:
                             self.logger.error("Insufficient SOL balance")
                             return False
 
-                        trade_amount = sol_balance * Decimal('0.1')
+                        trade_amount = sol_balance * BUY_BALANCE_FRACTION
                         params = {
                             'fromMint': self.sol_mint,
                             'toMint': token_address,
-                            'amount': str(int(trade_amount * 10**9)),
+                            'amount': str(int(trade_amount * LAMPORTS_PER_SOL)),
                             'slippage': 3000,
-                            'priorityMicroLamports': str(int(Decimal('0.0001') * 10**9)),
+                            'priorityMicroLamports': str(PRIORITY_MICRO_LAMPORTS),
                             'owner': self.wallet_address,
                             'provider': 'raydium'
                         }
@@ -235,7 +454,7 @@ class TradingBot:
                             'toMint': self.sol_mint,
                             'amount': str(raw_amount),
                             'slippage': slippage_bps,
-                            'priorityMicroLamports': str(int(Decimal('0.0001') * 10**9 * priority_multiplier)),
+                            'priorityMicroLamports': str(int(PRIORITY_MICRO_LAMPORTS * priority_multiplier)),
                             'owner': self.wallet_address,
                             'provider': 'raydium'
                         }
@@ -245,69 +464,68 @@ class TradingBot:
                         params=params,
                         headers={"X-API-KEY": self.api_key}
                     ) as response:
-                        swap_data = await response.json()
-                        if not swap_data.get("success"):
-                            error_msg = swap_data.get('message', 'Unknown error')
-                            self.logger.error(f"Swap API error: {error_msg}")
-                            print(swap_data)
+                        swap_data = await _read_json(response)
+
+                    if not swap_data.get("success"):
+                        error_msg = swap_data.get('message', 'Unknown error')
+                        self.logger.error(f"Swap API error: {error_msg}")
+                        print(swap_data)
+                        return False
+
+                    transaction = VersionedTransaction.from_bytes(base64.b64decode(swap_data["data"]["base64Transaction"], validate=False))
+                    signed_tx = VersionedTransaction(transaction.message, [self.keypair])
+
+                    # The price lookup doesn't depend on the send, so overlap the two round-trips
+                    tx_bytes = bytes(signed_tx)
+                    send_payload = _SEND_TRANSACTION_PREFIX + base64.b64encode(tx_bytes) + _SEND_TRANSACTION_SUFFIX
+                    result, price = await asyncio.gather(
+                        self._rpc_post(send_payload),
+                        self.get_token_price(token_address)
+                    )
+                    if 'error' in result:
+                        error_msg = result['error'].get('message', '')
+                        if any(msg in error_msg for msg in ['Blockhash not found', 'Transaction was not confirmed']):
+                            self.logger.warning(f"Transient error detected, retrying ({attempt}/{max_retries})")
+                            retry_delay = decorrelated_jitter(retry_delay)
+                            await asyncio.sleep(retry_delay)
+                            continue
+
+                        self.logger.error(f"Transaction failed: {error_msg}")
+                        return False
+
+                    if action == TradeAction.BUY:
+                        self.buy_price = price
+                        if not self.buy_price:
+                            self.logger.error("Failed to verify buy price")
                             return False
 
-                        transaction = VersionedTransaction.from_bytes(base64.b64decode(swap_data["data"]["base64Transaction"]))
-                        signed_tx = VersionedTransaction(transaction.message, [self.keypair])
-
-                        async with session.post(
-                            self.rpc_url,
-                            json={
-                                "jsonrpc": "2.0",
-                                "id": 1,
-                                "method": "sendTransaction",
-                                "params": [
-                                    base64.b64encode(bytes(signed_tx)).decode('utf-8'),
-                                    {
-                                        "encoding": "base64",
-                                        "skipPreflight": False,
-                                        "maxRetries": 3
-                                    }
-                                ]
-                            }
-                        ) as tx_response:
-                            result = await tx_response.json()
-                            if 'error' in result:
-                                error_msg = result['error'].get('message', '')
-                                if any(msg in error_msg for msg in ['Blockhash not found', 'Transaction was not confirmed']):
-                                    self.logger.warning(f"Transient error detected, retrying ({attempt}/{max_retries})")
-                                    await asyncio.sleep(retry_delay * (attempt + 1))
-                                    continue
-                                
-                                self.logger.error(f"Transaction failed: {error_msg}")
-                                return False
-
-                            if action == TradeAction.BUY:
-                                self.buy_price = await self.get_token_price(token_address)
-                                if not self.buy_price:
-                                    self.logger.error("Failed to verify buy price")
-                                    return False
-
-                                self.current_position = token_address
-                                self.position_open_time = time.time()
-                                self.trades_executed += 1
-                                self.logger.info(f"Bought {token_address} at ${self.buy_price:.6f}")
-                            else:
-                                sell_price = await self.get_token_price(token_address)
-                                if sell_price and token_info:
-                                    profit = (sell_price - self.buy_price) * token_info['ui_amount']
-                                    self.total_profit += profit
-                                    self.logger.info(f"Sold {token_address} | Profit: ${profit:.4f}")
-                                self.current_position = None
-                                self.position_open_time = None
-                                self.cooldown_end_time = time.time() + 15
-
-                            return True
+                        self.current_position = token_address
+                        self.position_open_time = time.time()
+                        self.position_closed.clear()
+                        self.trades_executed += 1
+                        self.logger.info(f"Bought {token_address} at ${self.buy_price:.6f}")
+                    else:
+                        sell_price = price
+                        if sell_price and token_info:
+                            profit = (sell_price - self.buy_price) * token_info['ui_amount']
+                            self.total_profit += profit
+                            self.logger.info(f"Sold {token_address} | Profit: ${profit:.4f}")
+                        self.close_position()
+                        self.cooldown_end_time = time.time() + 15
+
+                    return True
 
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Classify by how long the failures have lasted, not just how many attempts we made
+                self._note_network_failure()
+                outage = self.network_outage_duration()
+                if outage >= NETWORK_OUTAGE_LIMIT:
+                    self.logger.error(f"Network down for {outage:.0f}s, giving up: {str(e)}")
+                    return False
                 if attempt < max_retries:
                     self.logger.warning(f"Network error: {str(e)}, retrying ({attempt}/{max_retries})")
-                    await asyncio.sleep(retry_delay * (attempt + 1))
+                    retry_delay = decorrelated_jitter(retry_delay)
+                    await asyncio.sleep(retry_delay)
                     continue
                 self.logger.error(f"Network failure after {max_retries} retries: {str(e)}")
                 return False
@@ -318,41 +536,51 @@ class TradingBot:
 
     async def get_sol_balance(self) -> Decimal:
         try:
-            session = await self.get_session()
-            async with session.post(
-                self.rpc_url,
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "getBalance",
-                    "params": [self.wallet_address]
-                }
-            ) as response:
-                data = await response.json()
-                return Decimal(data['result']['value']) / Decimal(1e9)
+            data = await self._rpc_post(self._get_balance_payload)
+            return Decimal(data['result']['value']) / Decimal(1e9)
         except Exception as e:
             self.logger.error(f"SOL balance check failed: {str(e)}")
             return Decimal(0)
 
     async def get_token_price(self, token_address: str) -> Decimal:
+        """Latest price, reusing a very recent result or a lookup already in flight."""
+        cached = self._price_cache.get(token_address)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        request = self._price_requests.get(token_address)
+        if request is None:
+            request = asyncio.create_task(self._fetch_token_price(token_address))
+            self._price_requests[token_address] = request
+        # Shielded so one cancelled caller doesn't abort the lookup for the others
+        return await asyncio.shield(request)
+
+    async def _fetch_token_price(self, token_address: str) -> Decimal:
         try:
             session = await self.get_session()
             async with session.get(
                 "https://api.jup.ag/price/v2",
                 params={'ids': token_address}
             ) as response:
-                data = await response.json()
-                return Decimal(str(data['data'][token_address]['price']))
+                data = orjson.loads(await response.read())
+                price = Decimal(str(data['data'][token_address]['price']))
+            self._price_cache[token_address] = (time.monotonic() + PRICE_CACHE_TTL, price)
+            return price
         except Exception as e:
-            self.logger.error(f"Price check failed: {str(e)}")
+            # Failures aren't cached so the next caller retries immediately
+            self.logger.error("Price check failed: %s", e)
             return Decimal(0)
+        finally:
+            self._price_requests.pop(token_address, None)
 
     async def monitor_token(self, token_address: str):
         while self.current_position == token_address:
+            # Pace polls from their start so request latency doesn't stretch the interval
+            next_poll = time.monotonic() + PRICE_POLL_INTERVAL
             try:
                 current_price = await self.get_token_price(token_address)
                 if not current_price:
-                    await asyncio.sleep(2)
+                    await asyncio.sleep(max(0.0, next_poll - time.monotonic()))
                     continue
 
                 profit_pct = ((current_price - self.buy_price) / self.buy_price) * 100
@@ -374,10 +602,11 @@ class TradingBot:
                         is_valid, token_info = await self.verify_token_balance(token_address)
                         if not is_valid:
                             self.logger.error("Token balance verification failed after retry")
-                            self.current_position = None
+                            self.close_position()
                             break
 
                     retry_count = 0
+                    sell_retry_delay = 1.0
                     max_sell_retries = 4
                     multipliers = [1.0, 1.5, 2.0, 3.0]
                     slippages = [2000, 3000, 4000, 5000]
@@ -395,7 +624,7 @@ class TradingBot:
                         is_valid, _ = await self.verify_token_balance(token_address)
                         if not is_valid:
                             self.logger.error("Lost token balance during sell attempts")
-                            self.current_position = None
+                            self.close_position()
                             break
 
                         retry_count += 1
@@ -404,12 +633,13 @@ class TradingBot:
                                 f"Retrying sell with {multipliers[retry_count]}x priority fee "
                                 f"and {slippages[retry_count]/100}% slippage ({retry_count}/{max_sell_retries})..."
                             )
-                            await asyncio.sleep(1.5 ** retry_count)
+                            sell_retry_delay = decorrelated_jitter(sell_retry_delay, base=1.0)
+                            await asyncio.sleep(sell_retry_delay)
                     break
 
-                await asyncio.sleep(2)
+                await asyncio.sleep(max(0.0, next_poll - time.monotonic()))
             except Exception as e:
-                self.logger.error(f"Monitoring error: {str(e)}")
+                self.logger.error("Monitoring error: %s", e)
                 await asyncio.sleep(5)
 
     async def close(self):